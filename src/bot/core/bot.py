@@ -1,10 +1,45 @@
 import discord
 from discord.ext import commands
 
+from bot.core.diagnostics import Diagnostics, Listener
+
 
 class ZloutekBot(commands.Bot):
-    def __init__(self, command_prefix: str, intents: discord.Intents) -> None:
+    def __init__(
+        self,
+        command_prefix: str,
+        intents: discord.Intents,
+        diagnostics: Diagnostics | None = None,
+        enable_diagnostics: bool = False,
+        enable_slow_callbacks: bool = False,
+    ) -> None:
         super().__init__(command_prefix, intents=intents)
+        self.diagnostics = diagnostics or Diagnostics()
+        self._enable_diagnostics = enable_diagnostics
+        self._enable_slow_callbacks = enable_slow_callbacks
+        self._tracked_listeners: dict[tuple[str, Listener], Listener] = {}
+
+    async def setup_hook(self) -> None:
+        if self._enable_diagnostics:
+            self.diagnostics.enable()
+
+        if self._enable_slow_callbacks:
+            self.diagnostics.enable_slow_callbacks()
+
+    async def close(self) -> None:
+        self.diagnostics.lag_monitor.stop()
+        await super().close()
+
+    def add_listener(self, func: Listener, /, name: str = discord.utils.MISSING) -> None:
+        name = func.__name__ if name is discord.utils.MISSING else name
+        tracked = self.diagnostics.listener_stats.track(func)
+        self._tracked_listeners[(name, func)] = tracked
+        super().add_listener(tracked, name)
+
+    def remove_listener(self, func: Listener, /, name: str = discord.utils.MISSING) -> None:
+        name = func.__name__ if name is discord.utils.MISSING else name
+        tracked = self._tracked_listeners.pop((name, func), func)
+        super().remove_listener(tracked, name)
 
     async def on_ready(self) -> None:
         if not self.user:
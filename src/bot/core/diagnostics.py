@@ -0,0 +1,324 @@
+import asyncio
+import functools
+import logging
+import os
+import selectors
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+log = logging.getLogger(__name__)
+
+type Listener = Callable[..., Coroutine[Any, Any, Any]]
+type Frame = tuple[str, int, str]
+
+_ASYNCIO_DIR = os.path.dirname(asyncio.__file__) + os.sep
+_SELECTORS_FILE = selectors.__file__
+
+
+@dataclass
+class LagStats:
+    samples: int = 0
+    last: float = 0.0
+    max: float = 0.0
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+    def record(self, lag: float) -> None:
+        self.samples += 1
+        self.last = lag
+        self.max = max(self.max, lag)
+        self.total += lag
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag by sleeping for a fixed interval and recording
+    how late the loop woke us up. Lag above the threshold is logged as a warning.
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.stats = LagStats()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self.stats = LagStats()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="loop-lag-monitor")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self.stats.record(lag)
+
+            if lag >= self.threshold:
+                log.warning(f"Event loop lagged by {lag * 1000:.1f} ms")
+
+
+@dataclass
+class ListenerTiming:
+    calls: int = 0
+    failures: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass
+class ListenerStats:
+    """Per-listener wall-time tracking, keyed by the listener's qualified name."""
+
+    enabled: bool = False
+    threshold: float = 1.0
+    timings: dict[str, ListenerTiming] = field(default_factory=dict)
+
+    def track(self, func: Listener) -> Listener:
+        """Wrap a listener so that its wall time is recorded while tracking is enabled."""
+        key = func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return await func(*args, **kwargs)
+
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self._record(key, time.perf_counter() - started, failed)
+
+        return wrapper
+
+    def top(self, limit: int = 10) -> list[tuple[str, ListenerTiming]]:
+        return sorted(self.timings.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        self.timings.clear()
+
+    def _record(self, key: str, elapsed: float, failed: bool) -> None:
+        timing = self.timings.setdefault(key, ListenerTiming())
+        timing.calls += 1
+        timing.failures += failed
+        timing.total += elapsed
+        timing.max = max(timing.max, elapsed)
+
+        if elapsed >= self.threshold:
+            log.warning(f"Listener {key} took {elapsed * 1000:.1f} ms")
+
+
+@dataclass
+class ProfileReport:
+    duration: float
+    samples: int
+    own: Counter[Frame]
+    cumulative: Counter[Frame]
+    stacks: Counter[tuple[Frame, ...]]
+
+    def format_top(self, limit: int = 15, sort: Literal["cum", "own"] = "cum") -> str:
+        """
+        Render the hottest functions as a plain-text table, ranked by cumulative or own samples.
+
+        Time spent waiting in the selector is reported as idle rather than ranked, and
+        asyncio internals and the frames present in every sample are left out, since
+        they would otherwise crowd out the listeners and coroutines doing the work.
+        """
+        idle = sum(count for frame, count in self.own.items() if self._is_idle(frame))
+        ranking = self.cumulative if sort == "cum" else self.own
+        frames = [frame for frame, count in ranking.most_common() if count and self._is_relevant(frame)]
+
+        lines = [
+            f"{self.samples} samples over {self.duration:.1f}s, {self._percent(idle)} idle",
+            f"{'own':>6} {'cum':>6}  function",
+        ]
+        for frame in frames[:limit]:
+            own, cumulative = self.own[frame], self.cumulative[frame]
+            lines.append(f"{self._percent(own):>6} {self._percent(cumulative):>6}  {self._label(frame)}")
+        return "\n".join(lines)
+
+    def format_collapsed(self) -> str:
+        """Render the samples in the collapsed-stack format understood by flamegraph tools."""
+        return "\n".join(
+            f"{';'.join(self._label(frame) for frame in stack)} {count}" for stack, count in self.stacks.most_common()
+        )
+
+    def _is_relevant(self, frame: Frame) -> bool:
+        filename = frame[0]
+        return (
+            self.cumulative[frame] < self.samples
+            and not self._is_idle(frame)
+            and not filename.startswith(_ASYNCIO_DIR)
+            and filename != _SELECTORS_FILE
+        )
+
+    @staticmethod
+    def _is_idle(frame: Frame) -> bool:
+        return frame[0] == _SELECTORS_FILE and frame[2] == "select"
+
+    def _percent(self, count: int) -> str:
+        return f"{count / self.samples:.1%}" if self.samples else "-"
+
+    @staticmethod
+    def _label(frame: Frame) -> str:
+        filename, lineno, name = frame
+        return f"{name} ({filename}:{lineno})"
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that periodically captures the stack of a target thread
+    from a background thread. Overhead is bounded by the sampling interval and
+    nothing is installed on the profiled thread itself.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = 0.005) -> None:
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+
+    async def run(self, duration: float) -> ProfileReport:
+        """Sample the target thread for ``duration`` seconds without blocking the event loop."""
+        stop = threading.Event()
+        own: Counter[Frame] = Counter()
+        cumulative: Counter[Frame] = Counter()
+        stacks: Counter[tuple[Frame, ...]] = Counter()
+
+        sampler = threading.Thread(
+            target=self._sample, args=(stop, own, cumulative, stacks), name="sampling-profiler", daemon=True
+        )
+
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+
+        return ProfileReport(
+            duration=time.perf_counter() - started,
+            samples=sum(stacks.values()),
+            own=own,
+            cumulative=cumulative,
+            stacks=stacks,
+        )
+
+    def _sample(
+        self,
+        stop: threading.Event,
+        own: Counter[Frame],
+        cumulative: Counter[Frame],
+        stacks: Counter[tuple[Frame, ...]],
+    ) -> None:
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+
+            stack: list[Frame] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stack.reverse()
+
+            stacks[tuple(stack)] += 1
+            own[stack[-1]] += 1
+            cumulative.update(set(stack))
+
+
+class Diagnostics:
+    """
+    Opt-in runtime diagnostics for the bot: event-loop lag monitoring, per-listener
+    wall-time tracking and asyncio slow-callback reporting. Everything can be
+    toggled at runtime without restarting the process.
+
+    Slow-callback reporting relies on asyncio debug mode, which is expensive and
+    would skew the lag and listener numbers, so it is toggled separately.
+    """
+
+    def __init__(
+        self,
+        lag_interval: float = 0.5,
+        lag_threshold: float = 0.25,
+        slow_callback_duration: float = 0.1,
+        slow_listener_threshold: float = 1.0,
+    ) -> None:
+        self.lag_monitor = LoopLagMonitor(lag_interval, lag_threshold)
+        self.listener_stats = ListenerStats(threshold=slow_listener_threshold)
+        self.slow_callback_duration = slow_callback_duration
+        self._enabled = False
+        self._previous_loop_debug: tuple[bool, float] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def slow_callbacks_enabled(self) -> bool:
+        return self._previous_loop_debug is not None
+
+    def enable(self) -> None:
+        """Start collecting lag and listener timings. Must be called from within the running event loop."""
+        self.lag_monitor.start()
+        self.listener_stats.enabled = True
+        self._enabled = True
+        log.info("Diagnostics enabled")
+
+    def disable(self) -> None:
+        self.lag_monitor.stop()
+        self.listener_stats.enabled = False
+        self._enabled = False
+        log.info("Diagnostics disabled")
+
+    def enable_slow_callbacks(self) -> None:
+        """Turn on asyncio debug mode so that slow callbacks are logged by the ``asyncio`` logger."""
+        if self.slow_callbacks_enabled:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._previous_loop_debug = (loop.get_debug(), loop.slow_callback_duration)
+
+        loop.slow_callback_duration = self.slow_callback_duration
+        loop.set_debug(True)
+        log.info("Slow-callback reporting enabled")
+
+    def disable_slow_callbacks(self) -> None:
+        """Restore the event loop debug settings that were active before reporting was enabled."""
+        if self._previous_loop_debug is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        debug, slow_callback_duration = self._previous_loop_debug
+        loop.set_debug(debug)
+        loop.slow_callback_duration = slow_callback_duration
+        self._previous_loop_debug = None
+        log.info("Slow-callback reporting disabled")
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +7,15 @@ class Settings(BaseSettings):
 
     bot_token: str
     database_url: str
+    starboard_snapshot_path: str = "data/starboard.snapshot.json"
+    starboard_cache_size: int = Field(default=1000, ge=0)
+
+    diagnostics_enabled: bool = False
+    diagnostics_lag_interval: float = 0.5
+    diagnostics_lag_threshold: float = 0.25
+    diagnostics_slow_callbacks_enabled: bool = False
+    diagnostics_slow_callback_duration: float = 0.1
+    diagnostics_slow_listener_threshold: float = 1.0
 
 
 settings = Settings()
@@ -0,0 +1,11 @@
+from discord.ext import commands
+
+from bot.core.bot import ZloutekBot
+from bot.diagnostics.cog import DiagnosticsCog
+
+
+async def setup(bot: commands.Bot) -> None:
+    if not isinstance(bot, ZloutekBot):
+        raise TypeError("Diagnostics extension requires a ZloutekBot instance")
+
+    await bot.add_cog(DiagnosticsCog(bot))
@@ -0,0 +1,110 @@
+import io
+import logging
+from typing import Literal
+
+import discord
+from discord.ext import commands
+
+from bot.core.bot import ZloutekBot
+from bot.core.diagnostics import SamplingProfiler
+
+log = logging.getLogger(__name__)
+
+MAX_MESSAGE_LENGTH = 1900
+MAX_PROFILE_DURATION = 120.0
+
+
+class DiagnosticsCog(commands.Cog):
+    """Owner-only commands for inspecting the bot's runtime performance."""
+
+    # mypy cannot solve the ContextT/ParamSpec union in discord.py's Group.command overloads,
+    # hence the arg-type ignores on the subcommand decorators below.
+
+    def __init__(self, bot: ZloutekBot) -> None:
+        self.bot = bot
+        self.diagnostics = bot.diagnostics
+        self.profiler = SamplingProfiler()
+
+    @commands.group(name="diagnostics", aliases=["diag"], invoke_without_command=True)
+    @commands.is_owner()
+    async def diagnostics_group(self, ctx: commands.Context[ZloutekBot]) -> None:
+        await self._send_report(ctx, self._format_status())
+
+    @diagnostics_group.command(name="enable")  # type: ignore[arg-type]
+    @commands.is_owner()
+    async def enable(self, ctx: commands.Context[ZloutekBot]) -> None:
+        self.diagnostics.enable()
+        await ctx.send("Diagnostics enabled")
+
+    @diagnostics_group.command(name="disable")  # type: ignore[arg-type]
+    @commands.is_owner()
+    async def disable(self, ctx: commands.Context[ZloutekBot]) -> None:
+        self.diagnostics.disable()
+        await ctx.send("Diagnostics disabled")
+
+    @diagnostics_group.command(name="slowcallbacks")  # type: ignore[arg-type]
+    @commands.is_owner()
+    async def slow_callbacks(self, ctx: commands.Context[ZloutekBot], enabled: bool) -> None:
+        """Toggle asyncio slow-callback reporting, which runs the event loop in debug mode."""
+        if enabled:
+            self.diagnostics.enable_slow_callbacks()
+            await ctx.send("Slow-callback reporting enabled")
+        else:
+            self.diagnostics.disable_slow_callbacks()
+            await ctx.send("Slow-callback reporting disabled")
+
+    @diagnostics_group.command(name="reset")  # type: ignore[arg-type]
+    @commands.is_owner()
+    async def reset(self, ctx: commands.Context[ZloutekBot]) -> None:
+        self.diagnostics.listener_stats.reset()
+        await ctx.send("Listener statistics reset")
+
+    @diagnostics_group.command(name="profile")  # type: ignore[arg-type]
+    @commands.is_owner()
+    async def profile(
+        self,
+        ctx: commands.Context[ZloutekBot],
+        seconds: float = 10.0,
+        top: int = 15,
+        sort: Literal["cum", "own"] = "cum",
+        as_file: bool = False,
+    ) -> None:
+        """
+        Sample the event loop thread for a number of seconds and report the hottest functions,
+        ranked by cumulative (default) or own samples.
+        """
+        seconds = min(max(seconds, 0.1), MAX_PROFILE_DURATION)
+        await ctx.send(f"Profiling for {seconds:.1f}s...")
+
+        report = await self.profiler.run(seconds)
+        log.info(f"Captured {report.samples} profile samples over {report.duration:.1f}s")
+
+        await self._send_report(ctx, report.format_top(top, sort))
+
+        if as_file:
+            data = io.BytesIO(report.format_collapsed().encode())
+            await ctx.send(file=discord.File(data, filename="profile.collapsed.txt"))
+
+    def _format_status(self) -> str:
+        lag = self.diagnostics.lag_monitor.stats
+        lines = [
+            f"enabled: {self.diagnostics.enabled}",
+            f"loop lag: last {lag.last * 1000:.1f} ms, mean {lag.mean * 1000:.1f} ms, "
+            f"max {lag.max * 1000:.1f} ms ({lag.samples} samples)",
+            f"slow callbacks: {self.diagnostics.slow_callbacks_enabled} "
+            f"(threshold {self.diagnostics.slow_callback_duration * 1000:.0f} ms)",
+            "",
+            f"{'calls':>7} {'failed':>7} {'mean ms':>9} {'max ms':>9}  listener",
+        ]
+        for name, timing in self.diagnostics.listener_stats.top():
+            lines.append(
+                f"{timing.calls:>7} {timing.failures:>7} {timing.mean * 1000:>9.1f} {timing.max * 1000:>9.1f}  {name}"
+            )
+
+        return "\n".join(lines)
+
+    async def _send_report(self, ctx: commands.Context[ZloutekBot], report: str) -> None:
+        if len(report) <= MAX_MESSAGE_LENGTH:
+            await ctx.send(f"```\n{report}\n```")
+        else:
+            await ctx.send(file=discord.File(io.BytesIO(report.encode()), filename="report.txt"))
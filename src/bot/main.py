@@ -1,12 +1,18 @@
 import asyncio
+import contextlib
+import logging
+import signal
 
 import discord
 
 from bot.core.bot import ZloutekBot
 from bot.core.database import create_tables
+from bot.core.diagnostics import Diagnostics
 from bot.core.logging import setup_logging
 from bot.core.settings import settings
 
+log = logging.getLogger(__name__)
+
 
 async def main() -> None:
     setup_logging()
@@ -15,12 +21,38 @@ async def main() -> None:
     intents.members = True
     intents.message_content = True
 
-    bot = ZloutekBot(command_prefix="!", intents=intents)
-    await bot.load_extension("bot.starboard")
+    diagnostics = Diagnostics(
+        lag_interval=settings.diagnostics_lag_interval,
+        lag_threshold=settings.diagnostics_lag_threshold,
+        slow_callback_duration=settings.diagnostics_slow_callback_duration,
+        slow_listener_threshold=settings.diagnostics_slow_listener_threshold,
+    )
+
+    bot = ZloutekBot(
+        command_prefix="!",
+        intents=intents,
+        diagnostics=diagnostics,
+        enable_diagnostics=settings.diagnostics_enabled,
+        enable_slow_callbacks=settings.diagnostics_slow_callbacks_enabled,
+    )
 
     await create_tables()
 
-    await bot.start(settings.bot_token)
+    # Cancel on SIGTERM so deploys shut down gracefully and cogs get unloaded
+    main_task = asyncio.current_task()
+    if main_task:
+        # Signal handlers are not supported by Windows event loops
+        with contextlib.suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+
+    try:
+        async with bot:
+            await bot.load_extension("bot.diagnostics")
+            await bot.load_extension("bot.starboard")
+
+            await bot.start(settings.bot_token)
+    except asyncio.CancelledError:
+        log.info("Shutdown requested, bot stopped")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
+from pathlib import Path
+
 from discord.ext import commands
 
 from bot.core.database import async_session_factory
+from bot.core.settings import settings
 from bot.starboard.adapters.database.repository import OrmStarboardMapper, OrmStarboardRepository
 from bot.starboard.adapters.discord.cog import StarboardCog
 from bot.starboard.adapters.discord.presenter import DiscordStarboardPresenter
 from bot.starboard.adapters.discord.publisher import DiscordStarboardPublisher
+from bot.starboard.adapters.filesystem.snapshot import JsonStarboardSnapshotStore
 from bot.starboard.application.services import StarboardService
 
 
@@ -12,7 +16,8 @@ async def setup(bot: commands.Bot) -> None:
     repository = OrmStarboardRepository(session_factory=async_session_factory, mapper=OrmStarboardMapper())
     publisher = DiscordStarboardPublisher(bot)
     presenter = DiscordStarboardPresenter()
+    snapshot_store = JsonStarboardSnapshotStore(Path(settings.starboard_snapshot_path))
 
-    service = StarboardService(repository, publisher, presenter)
+    service = StarboardService(repository, publisher, presenter, snapshot_store, settings.starboard_cache_size)
     cog = StarboardCog(bot, service)
     await bot.add_cog(cog)
@@ -60,6 +60,13 @@ class OrmStarboardRepository:
 
             return self.mapper.to_model(entity) if entity else None
 
+    async def find_updated_since(self, since: datetime) -> list[StarboardEntry]:
+        async with self.session_factory() as session:
+            stmt = select(StarboardMessageTable).where(StarboardMessageTable.updated_at > since)
+            result = await session.execute(stmt)
+
+            return [self.mapper.to_model(entity) for entity in result.scalars()]
+
     async def save(self, entry: StarboardEntry) -> None:
         if await self.find_by_message_id(entry.original_message_id):
             await self._update(entry)
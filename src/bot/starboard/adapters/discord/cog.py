@@ -18,6 +18,12 @@ class StarboardCog(commands.Cog):
         self.message_mapper = MessageMapper()
         self.reaction_mapper = ReactionMapper()
 
+    async def cog_load(self) -> None:
+        await self.service.restore_snapshot()
+
+    async def cog_unload(self) -> None:
+        await self.service.save_snapshot()
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
         if not self._is_relevant_reaction_event(payload):
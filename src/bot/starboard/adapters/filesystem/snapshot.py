@@ -0,0 +1,46 @@
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from bot.starboard.application.ports import StarboardSnapshot
+
+log = logging.getLogger(__name__)
+
+
+class JsonStarboardSnapshotStore:
+    """Stores the starboard snapshot as a single compact JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    async def load(self) -> StarboardSnapshot | None:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, snapshot: StarboardSnapshot) -> None:
+        await asyncio.to_thread(self._write, snapshot)
+
+    def _read(self) -> StarboardSnapshot | None:
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as ex:
+            log.warning(f"Cannot read starboard snapshot {self.path}: {ex}")
+            return None
+
+        try:
+            return StarboardSnapshot.model_validate_json(data)
+        except ValidationError as ex:
+            log.warning(f"Ignoring unreadable starboard snapshot {self.path}: {ex}")
+            return None
+
+    def _write(self, snapshot: StarboardSnapshot) -> None:
+        os.makedirs(self.path.parent, exist_ok=True)
+
+        # Write to a temporary file first so a crash never leaves a half-written snapshot behind
+        temp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        temp_path.write_text(snapshot.model_dump_json(), encoding="utf-8")
+        os.replace(temp_path, self.path)
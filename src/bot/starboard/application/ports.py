@@ -41,6 +41,29 @@ class StarboardRepository(Protocol):
 
     async def save(self, entry: StarboardEntry) -> None: ...
 
+    async def find_updated_since(self, since: datetime) -> list[StarboardEntry]: ...
+
+
+class StarboardSnapshot(BaseModel):
+    """
+    Point-in-time copy of the starboard service's in-memory state,
+    persisted on shutdown so the next process can start warm.
+    """
+
+    version: int
+    taken_at: datetime
+    entries: list[StarboardEntry]
+
+
+class StarboardSnapshotStore(Protocol):
+    async def load(self) -> StarboardSnapshot | None:
+        """Load the last written snapshot, or None if there is no usable one."""
+        ...
+
+    async def save(self, snapshot: StarboardSnapshot) -> None:
+        """Persist the snapshot, replacing any previous one."""
+        ...
+
 
 class StarboardPresentation(BaseModel):
     author_display_name: str
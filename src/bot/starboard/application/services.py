@@ -1,24 +1,101 @@
 import logging
+from collections import OrderedDict
+from datetime import datetime
 
+from bot.core.typing import Id
 from bot.starboard.application.ports import (
     StarboardMessage,
     StarboardPresenter,
     StarboardPublisher,
     StarboardReaction,
     StarboardRepository,
+    StarboardSnapshot,
+    StarboardSnapshotStore,
 )
 from bot.starboard.domain.models import StarboardEntry
 
 log = logging.getLogger(__name__)
 
+SNAPSHOT_VERSION = 1
+
 
 class StarboardService:
-    def __init__(self, repository: StarboardRepository, notifier: StarboardPublisher, presenter: StarboardPresenter):
+    def __init__(
+        self,
+        repository: StarboardRepository,
+        notifier: StarboardPublisher,
+        presenter: StarboardPresenter,
+        snapshot_store: StarboardSnapshotStore | None = None,
+        cache_size: int = 1000,
+    ):
         self._repository = repository
         self._notifier = notifier
         self._presenter = presenter
+        self._snapshot_store = snapshot_store
         self._starboard_channel_id = 1393196186164264980
 
+        if cache_size < 0:
+            raise ValueError(f"Cache size must not be negative, got {cache_size}")
+
+        # Hot state, keyed by original message ID and kept in least-recently-used order
+        self._cache_size = cache_size
+        self._entries: OrderedDict[Id, StarboardEntry] = OrderedDict()
+
+    async def restore_snapshot(self) -> None:
+        """
+        Warm the in-memory state from the last snapshot, if there is one.
+
+        Entries changed in the database after the snapshot was taken
+        are reloaded from the database, so a stale snapshot is never trusted.
+        Failures are logged and leave the service cold rather than broken.
+        """
+        if not self._snapshot_store:
+            return
+
+        snapshot = await self._snapshot_store.load()
+        if not snapshot:
+            return
+
+        if snapshot.version != SNAPSHOT_VERSION:
+            log.warning(f"Ignoring starboard snapshot with version {snapshot.version}, expected {SNAPSHOT_VERSION}")
+            return
+
+        try:
+            changed_entries = await self._repository.find_updated_since(snapshot.taken_at)
+        except Exception:
+            log.exception("Failed to validate starboard snapshot against the database, starting cold")
+            return
+
+        for entry in snapshot.entries:
+            self._remember(entry)
+
+        for entry in sorted(changed_entries, key=lambda entry: entry.updated_at):
+            self._remember(entry)
+
+        log.info(
+            f"Restored {len(self._entries)} starboard entries from snapshot taken at {snapshot.taken_at}, "
+            f"{len(changed_entries)} refreshed from the database"
+        )
+
+    async def save_snapshot(self) -> None:
+        """Persist the in-memory state so the next start can be warm."""
+        if not self._snapshot_store:
+            return
+
+        snapshot = StarboardSnapshot(
+            version=SNAPSHOT_VERSION,
+            taken_at=datetime.now(),
+            entries=list(self._entries.values()),
+        )
+
+        try:
+            await self._snapshot_store.save(snapshot)
+        except Exception:
+            log.exception("Failed to save starboard snapshot, next start will be cold")
+            return
+
+        log.info(f"Saved starboard snapshot with {len(snapshot.entries)} entries")
+
     async def handle_reaction_added(self, message: StarboardMessage, reaction: StarboardReaction) -> None:
         if not self._should_be_starred(message, reaction):
             log.debug(
@@ -26,7 +103,7 @@ class StarboardService:
             )
             return
 
-        existing_entry = await self._repository.find_by_message_id(message.id)
+        existing_entry = await self._find_entry(message.id)
 
         if existing_entry and existing_entry.starboard_message_id:
             await self._update_starred_message(message, reaction, existing_entry)
@@ -45,17 +122,40 @@ class StarboardService:
         self, message: StarboardMessage, reaction: StarboardReaction, entry: StarboardEntry
     ) -> None:
         updated_entry = entry.update_timestamp()
-        await self._repository.save(updated_entry)
+        await self._save_entry(updated_entry)
 
         presentation = await self._presenter.create_presentation(message, reaction, updated_entry)
         await self._notifier.update_starboard_message(updated_entry, presentation)
 
     async def _star_message(self, message: StarboardMessage, reaction: StarboardReaction) -> None:
         new_entry = StarboardEntry.create(message.id, self._starboard_channel_id)
-        await self._repository.save(new_entry)
+        await self._save_entry(new_entry)
 
         presentation = await self._presenter.create_presentation(message, reaction, new_entry)
         starboard_message_id = await self._notifier.post_starboard_message(new_entry, presentation)
 
         posted_entry = new_entry.assign_starboard_message(starboard_message_id)
-        await self._repository.save(posted_entry)
+        await self._save_entry(posted_entry)
+
+    async def _find_entry(self, message_id: Id) -> StarboardEntry | None:
+        entry = self._entries.get(message_id)
+        if entry:
+            self._entries.move_to_end(message_id)
+            return entry
+
+        entry = await self._repository.find_by_message_id(message_id)
+        if entry:
+            self._remember(entry)
+
+        return entry
+
+    async def _save_entry(self, entry: StarboardEntry) -> None:
+        await self._repository.save(entry)
+        self._remember(entry)
+
+    def _remember(self, entry: StarboardEntry) -> None:
+        self._entries[entry.original_message_id] = entry
+        self._entries.move_to_end(entry.original_message_id)
+
+        while len(self._entries) > self._cache_size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,126 @@
+import asyncio
+from collections import Counter
+
+import discord
+import pytest
+from discord.ext import commands
+
+from bot.core.bot import ZloutekBot
+from bot.core.diagnostics import _SELECTORS_FILE, Diagnostics, ListenerStats, ProfileReport
+
+
+class ListenerCog(commands.Cog):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @commands.Cog.listener()
+    async def on_message(self, message: object) -> None:
+        self.calls += 1
+
+
+def test_track_records_only_while_enabled() -> None:
+    stats = ListenerStats()
+
+    async def listener() -> int:
+        return 42
+
+    tracked = stats.track(listener)
+
+    assert asyncio.run(tracked()) == 42
+    assert stats.timings == {}
+
+    stats.enabled = True
+    assert asyncio.run(tracked()) == 42
+
+    timing = stats.timings[listener.__qualname__]
+    assert timing.calls == 1
+    assert timing.failures == 0
+
+
+def test_track_counts_failures_but_not_cancellation() -> None:
+    stats = ListenerStats(enabled=True)
+
+    async def failing() -> None:
+        raise ValueError("boom")
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(ValueError):
+        asyncio.run(stats.track(failing)())
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(stats.track(cancelled)())
+
+    assert stats.timings[failing.__qualname__].failures == 1
+    assert stats.timings[cancelled.__qualname__].calls == 1
+    assert stats.timings[cancelled.__qualname__].failures == 0
+
+
+def test_cog_listeners_are_tracked_and_removed() -> None:
+    async def scenario() -> None:
+        bot = ZloutekBot(command_prefix="!", intents=discord.Intents.none())
+        bot.diagnostics.listener_stats.enabled = True
+        cog = ListenerCog()
+
+        await bot.add_cog(cog)
+        [listener] = bot.extra_events["on_message"]
+        await listener(object())
+
+        assert cog.calls == 1
+        assert bot.diagnostics.listener_stats.timings["ListenerCog.on_message"].calls == 1
+
+        await bot.remove_cog("ListenerCog")
+        assert bot.extra_events["on_message"] == []
+
+    asyncio.run(scenario())
+
+
+def test_slow_callbacks_restore_previous_loop_settings() -> None:
+    async def scenario() -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = 0.3
+
+        diagnostics = Diagnostics(slow_callback_duration=0.05)
+        diagnostics.enable_slow_callbacks()
+        assert loop.get_debug()
+        assert loop.slow_callback_duration == 0.05
+
+        diagnostics.disable_slow_callbacks()
+        assert loop.get_debug()
+        assert loop.slow_callback_duration == 0.3
+        assert not diagnostics.slow_callbacks_enabled
+
+    asyncio.run(scenario())
+
+
+def test_enable_leaves_loop_debug_untouched() -> None:
+    async def scenario() -> None:
+        diagnostics = Diagnostics()
+        diagnostics.enable()
+        assert not asyncio.get_running_loop().get_debug()
+        diagnostics.disable()
+
+    asyncio.run(scenario())
+
+
+def test_format_top_ranks_by_cumulative_and_reports_idle() -> None:
+    root = ("main.py", 1, "<module>")
+    idle = (_SELECTORS_FILE, 1, "select")
+    listener = ("cog.py", 10, "on_raw_reaction_add")
+    leaf = ("repository.py", 20, "find_by_message_id")
+
+    stacks = Counter({(root, idle): 6, (root, listener, leaf): 3, (root, listener): 1})
+    own = Counter({idle: 6, leaf: 3, listener: 1})
+    cumulative = Counter({root: 10, idle: 6, listener: 4, leaf: 3})
+    report = ProfileReport(duration=1.0, samples=10, own=own, cumulative=cumulative, stacks=stacks)
+
+    lines = report.format_top().splitlines()
+
+    assert "60.0% idle" in lines[0]
+    assert "on_raw_reaction_add" in lines[2]
+    assert "find_by_message_id" in lines[3]
+    assert len(lines) == 4
+
+    own_lines = report.format_top(sort="own").splitlines()
+    assert "find_by_message_id" in own_lines[2]
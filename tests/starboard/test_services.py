@@ -0,0 +1,198 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from bot.core.typing import Id
+from bot.starboard.adapters.filesystem.snapshot import JsonStarboardSnapshotStore
+from bot.starboard.application.ports import (
+    StarboardMessage,
+    StarboardPresentation,
+    StarboardReaction,
+    StarboardSnapshot,
+)
+from bot.starboard.application.services import SNAPSHOT_VERSION, StarboardService
+from bot.starboard.domain.models import StarboardEntry
+
+SNAPSHOT_TIME = datetime(2025, 1, 1, 12, 0)
+
+
+class FakeRepository:
+    def __init__(self, *entries: StarboardEntry) -> None:
+        self.entries = {entry.original_message_id: entry for entry in entries}
+        self.lookups = 0
+
+    async def find_by_message_id(self, message_id: Id) -> StarboardEntry | None:
+        self.lookups += 1
+        return self.entries.get(message_id)
+
+    async def save(self, entry: StarboardEntry) -> None:
+        self.entries[entry.original_message_id] = entry
+
+    async def find_updated_since(self, since: datetime) -> list[StarboardEntry]:
+        return [entry for entry in self.entries.values() if entry.updated_at > since]
+
+
+class FakeSnapshotStore:
+    def __init__(self, snapshot: StarboardSnapshot | None = None) -> None:
+        self.snapshot = snapshot
+
+    async def load(self) -> StarboardSnapshot | None:
+        return self.snapshot
+
+    async def save(self, snapshot: StarboardSnapshot) -> None:
+        self.snapshot = snapshot
+
+
+class FakePublisher:
+    def __init__(self) -> None:
+        self.updated: list[Id] = []
+
+    async def post_starboard_message(self, entry: StarboardEntry, presentation: StarboardPresentation) -> Id:
+        return entry.original_message_id + 1000
+
+    async def update_starboard_message(self, entry: StarboardEntry, presentation: StarboardPresentation) -> None:
+        assert entry.starboard_message_id is not None
+        self.updated.append(entry.starboard_message_id)
+
+
+class FakePresenter:
+    async def create_presentation(
+        self, message: StarboardMessage, reaction: StarboardReaction, entry: StarboardEntry
+    ) -> StarboardPresentation:
+        return StarboardPresentation(
+            author_display_name=message.author_display_name,
+            author_avatar_url=None,
+            message_content=message.content,
+            reactions_display=f"{reaction.count} {reaction.emoji}",
+            jump_url=message.jump_url,
+            channel_mention=f"<#{message.channel_id}>",
+            color="#FFD700",
+            timestamp=message.created_at,
+        )
+
+
+def make_entry(
+    message_id: Id, starboard_message_id: Id | None = None, updated_at: datetime = SNAPSHOT_TIME
+) -> StarboardEntry:
+    return StarboardEntry(
+        original_message_id=message_id,
+        starboard_message_id=starboard_message_id,
+        starboard_channel_id=1,
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+
+
+def make_snapshot(*entries: StarboardEntry, version: int = SNAPSHOT_VERSION) -> StarboardSnapshot:
+    return StarboardSnapshot(version=version, taken_at=SNAPSHOT_TIME, entries=list(entries))
+
+
+def make_service(
+    repository: FakeRepository, store: FakeSnapshotStore, publisher: FakePublisher | None = None, cache_size: int = 1000
+) -> StarboardService:
+    return StarboardService(repository, publisher or FakePublisher(), FakePresenter(), store, cache_size)
+
+
+def make_message(message_id: Id) -> StarboardMessage:
+    return StarboardMessage(
+        id=message_id,
+        channel_id=2,
+        guild_id=3,
+        author_id=4,
+        author_display_name="author",
+        author_avatar_url=None,
+        content="content",
+        attachment_urls=[],
+        jump_url="https://discord.com/channels/3/2/1",
+        created_at=SNAPSHOT_TIME,
+    )
+
+
+def cached_ids(store: FakeSnapshotStore) -> list[Id]:
+    assert store.snapshot is not None
+    return [entry.original_message_id for entry in store.snapshot.entries]
+
+
+def test_restore_serves_entries_without_database_lookups() -> None:
+    repository = FakeRepository(make_entry(1, starboard_message_id=11))
+    store = FakeSnapshotStore(make_snapshot(make_entry(1, starboard_message_id=11)))
+    publisher = FakePublisher()
+    service = make_service(repository, store, publisher)
+
+    async def scenario() -> None:
+        await service.restore_snapshot()
+        await service.handle_reaction_added(make_message(1), StarboardReaction(emoji="⭐", count=2, message_id=1))
+
+    asyncio.run(scenario())
+
+    assert repository.lookups == 0
+    assert publisher.updated == [11]
+
+
+def test_restore_ignores_snapshot_with_other_version() -> None:
+    store = FakeSnapshotStore(make_snapshot(make_entry(1, starboard_message_id=11), version=SNAPSHOT_VERSION + 1))
+    service = make_service(FakeRepository(), store)
+
+    asyncio.run(service.restore_snapshot())
+    asyncio.run(service.save_snapshot())
+
+    assert cached_ids(store) == []
+
+
+def test_restore_prefers_entries_updated_in_database_after_snapshot() -> None:
+    refreshed = make_entry(1, starboard_message_id=12, updated_at=SNAPSHOT_TIME + timedelta(minutes=5))
+    added = make_entry(3, starboard_message_id=33, updated_at=SNAPSHOT_TIME + timedelta(minutes=1))
+    repository = FakeRepository(refreshed, make_entry(2, starboard_message_id=22), added)
+    store = FakeSnapshotStore(
+        make_snapshot(make_entry(1, starboard_message_id=11), make_entry(2, starboard_message_id=22))
+    )
+    service = make_service(repository, store)
+
+    asyncio.run(service.restore_snapshot())
+    asyncio.run(service.save_snapshot())
+
+    assert store.snapshot is not None
+    assert cached_ids(store) == [2, 3, 1]
+    assert store.snapshot.entries[-1].starboard_message_id == 12
+
+
+def test_cache_evicts_least_recently_used_entries() -> None:
+    entries = [make_entry(message_id, starboard_message_id=message_id + 10) for message_id in (1, 2, 3)]
+    repository = FakeRepository(*entries)
+    store = FakeSnapshotStore(make_snapshot(*entries[:2]))
+    service = make_service(repository, store, cache_size=2)
+
+    async def scenario() -> None:
+        await service.restore_snapshot()
+        await service.handle_reaction_added(make_message(1), StarboardReaction(emoji="⭐", count=2, message_id=1))
+        await service.handle_reaction_added(make_message(3), StarboardReaction(emoji="⭐", count=2, message_id=3))
+        await service.save_snapshot()
+
+    asyncio.run(scenario())
+
+    assert cached_ids(store) == [1, 3]
+
+
+def test_negative_cache_size_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        make_service(FakeRepository(), FakeSnapshotStore(), cache_size=-1)
+
+
+def test_snapshot_round_trips_through_json_store(tmp_path: Path) -> None:
+    store = JsonStarboardSnapshotStore(tmp_path / "data" / "snapshot.json")
+    snapshot = make_snapshot(make_entry(1, starboard_message_id=11), make_entry(2))
+
+    asyncio.run(store.save(snapshot))
+
+    assert asyncio.run(store.load()) == snapshot
+
+
+def test_json_store_treats_unreadable_snapshot_as_missing(tmp_path: Path) -> None:
+    corrupted = tmp_path / "corrupted.json"
+    corrupted.write_text("{not json", encoding="utf-8")
+
+    assert asyncio.run(JsonStarboardSnapshotStore(tmp_path / "missing.json").load()) is None
+    assert asyncio.run(JsonStarboardSnapshotStore(corrupted).load()) is None
+    assert asyncio.run(JsonStarboardSnapshotStore(tmp_path).load()) is None